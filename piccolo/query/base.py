@@ -69,14 +69,15 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
             json_column_names: t.List[str] = []
 
             if columns_delegate is not None:
-                json_columns: t.List[t.Union[JSON, JSONB]] = []
-
-                for column in columns_delegate.selected_columns:
-                    if isinstance(column, (JSON, JSONB)):
-                        json_columns.append(column)
-                    elif isinstance(column, JSONQueryString):
-                        if alias := column._alias:
-                            json_column_names.append(alias)
+                json_columns: t.List[t.Union[JSON, JSONB]] = (
+                    columns_delegate.get_selected_of_type((JSON, JSONB))
+                )
+
+                for json_querystring in columns_delegate.get_selected_of_type(
+                    JSONQueryString
+                ):
+                    if alias := json_querystring._alias:
+                        json_column_names.append(alias)
             else:
                 json_columns = self.table._meta.json_columns
 
@@ -88,17 +89,14 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
                 else:
                     json_column_names.append(column._meta.name)
 
-            processed_raw = []
-
-            for row in raw:
-                new_row = {**row}
-                for json_column_name in json_column_names:
-                    value = new_row.get(json_column_name)
+            # The rows are freshly created for each query, so can be modified
+            # in place. Doing a pass per column means the loop body is as
+            # small as possible.
+            for json_column_name in json_column_names:
+                for row in raw:
+                    value = row.get(json_column_name)
                     if value is not None:
-                        new_row[json_column_name] = load_json(value)
-                processed_raw.append(new_row)
-
-            raw = processed_raw
+                        row[json_column_name] = load_json(value)
 
         #######################################################################
 
@@ -24,7 +24,7 @@ from piccolo.query.mixins import (
 )
 from piccolo.query.proxy import Proxy
 from piccolo.querystring import QueryString
-from piccolo.utils.dictionary import make_nested
+from piccolo.utils.dictionary import make_nested_list
 from piccolo.utils.sync import run_sync
 
 if t.TYPE_CHECKING:  # pragma: no cover
@@ -444,7 +444,7 @@ class Objects(
 
     async def response_handler(self, response):
         if self.output_delegate._output.nested:
-            return [make_nested(i) for i in response]
+            return make_nested_list(response)
         else:
             return response
 
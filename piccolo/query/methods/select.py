@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import itertools
 import typing as t
-from collections import OrderedDict
 
 from piccolo.columns import Column, Selectable
-from piccolo.columns.column_types import JSON, JSONB
+from piccolo.columns.column_types import JSON, JSONB, ForeignKey
 from piccolo.columns.m2m import M2MSelect
 from piccolo.columns.readable import Readable
 from piccolo.custom_types import TableInstance
@@ -16,8 +14,10 @@ from piccolo.query.mixins import (
     CallbackDelegate,
     CallbackType,
     ColumnsDelegate,
+    Distinct,
     DistinctDelegate,
     GroupByDelegate,
+    LazyDelegate,
     LimitDelegate,
     LockRowsDelegate,
     LockStrength,
@@ -29,7 +29,7 @@ from piccolo.query.mixins import (
 )
 from piccolo.query.proxy import Proxy
 from piccolo.querystring import QueryString
-from piccolo.utils.dictionary import make_nested
+from piccolo.utils.dictionary import make_nested_list
 from piccolo.utils.encoding import dump_json, load_json
 from piccolo.utils.warnings import colored_warning
 
@@ -69,6 +69,170 @@ class SelectRaw(Selectable):
         return self.querystring
 
 
+# Used when ``distinct`` hasn't been called, so the query doesn't need its own
+# ``DistinctDelegate``.
+_DISTINCT_DISABLED = Distinct(enabled=False, on=None)
+
+
+def _get_join_template(key: ForeignKey) -> t.Tuple[str, str]:
+    """
+    Returns the ``LEFT JOIN`` clause for the foreign key, split either side of
+    the name of the table being joined from, which depends on where the
+    foreign key is in the call chain.
+
+    Everything else is cached on the foreign key's ``_meta``, and is only
+    rebuilt if the foreign key's call chain, or the referenced table's name,
+    changes.
+    """
+    call_chain = key._meta.call_chain
+    right_tablename = (
+        key._foreign_key_meta.resolved_references._meta.get_formatted_tablename()  # noqa: E501
+    )
+
+    cached = getattr(key._meta, "_join_template", None)
+    if cached is not None:
+        chain, chain_length, tablename, template = cached
+        if (
+            chain is call_chain
+            and chain_length == len(call_chain)
+            and tablename == right_tablename
+        ):
+            return template
+
+    table_alias = key.table_alias
+    pk_name = key._foreign_key_meta.resolved_target_column._meta.name
+
+    template = (
+        f'LEFT JOIN {right_tablename} "{table_alias}" ON (',
+        f'."{key._meta.db_column_name}" = "{table_alias}"."{pk_name}")',
+    )
+
+    setattr(
+        key._meta,
+        "_join_template",
+        (call_chain, len(call_chain), right_tablename, template),
+    )
+
+    return template
+
+
+def _get_column_joins(column: Column) -> t.List[str]:
+    """
+    Returns the ``LEFT JOIN`` clauses needed to retrieve the column, based on
+    its call chain.
+
+    They're cached on the column's ``_meta``, as the call chain doesn't
+    normally change once the column has been created. The cache is rebuilt if
+    the call chain, or the schema of any of the joined tables, changes.
+    """
+    call_chain = column._meta.call_chain
+
+    cached = getattr(column._meta, "_join_cache", None)
+    if cached is not None:
+        chain, chain_length, cached_tables, schemas, cached_joins = cached
+        if (
+            chain is call_chain
+            and chain_length == len(call_chain)
+            and all(
+                table._meta.schema == schema
+                for table, schema in zip(cached_tables, schemas)
+            )
+        ):
+            return cached_joins
+
+    tables: t.List[t.Type[Table]] = []
+    joins: t.List[str] = []
+
+    for index, key in enumerate(call_chain, 0):
+        if index > 0:
+            left_tablename = call_chain[index - 1].table_alias
+        else:
+            tables.append(key._meta.table)
+            left_tablename = key._meta.table._meta.get_formatted_tablename()
+
+        tables.append(key._foreign_key_meta.resolved_references)
+
+        before, after = _get_join_template(key)
+        joins.append(f"{before}{left_tablename}{after}")
+
+    setattr(
+        column._meta,
+        "_join_cache",
+        (
+            call_chain,
+            len(call_chain),
+            tables,
+            [table._meta.schema for table in tables],
+            joins,
+        ),
+    )
+
+    return joins
+
+
+def _get_column_key(column: Column) -> str:
+    """
+    The key used for the column's value in the rows returned by a select.
+    """
+    return column._alias or column._meta.get_default_alias()
+
+
+def _get_selectable_key(selectable: Selectable) -> t.Optional[str]:
+    """
+    The key used for the selectable's value in the rows returned by a select,
+    or ``None`` if it isn't known until the query is run (for example a
+    ``QueryString`` without an alias).
+    """
+    if isinstance(selectable, Column):
+        return _get_column_key(selectable)
+    elif isinstance(selectable, M2MSelect):
+        return selectable.m2m._meta.name
+    elif isinstance(selectable, Readable):
+        return selectable.output_name
+    elif isinstance(selectable, QueryString):
+        return selectable._alias
+    return None
+
+
+def _group_m2m_selects(
+    m2m_selects: t.Sequence[M2MSelect],
+) -> t.List[t.List[M2MSelect]]:
+    """
+    Groups the ``M2MSelect`` instances, so the related rows for each group
+    can be fetched using a single query. They must share the same secondary
+    table and ``load_json`` value, and the keys of their columns mustn't clash.
+    """
+    groups: t.List[t.List[M2MSelect]] = []
+    group_columns: t.List[t.Dict[str, str]] = []
+
+    for m2m_select in m2m_selects:
+        secondary_table = m2m_select.m2m._meta.secondary_table
+        column_names = {
+            _get_column_key(column): column._meta.get_full_name(
+                with_alias=False
+            )
+            for column in m2m_select.columns
+        }
+
+        for group, columns in zip(groups, group_columns):
+            if (
+                group[0].m2m._meta.secondary_table is secondary_table
+                and group[0].load_json == m2m_select.load_json
+                and all(
+                    columns.get(key, name) == name
+                    for key, name in column_names.items()
+                )
+            ):
+                group.append(m2m_select)
+                columns.update(column_names)
+                break
+        else:
+            groups.append([m2m_select])
+            group_columns.append(column_names)
+
+    return groups
+
+
 OptionalDict = t.Optional[t.Dict[str, t.Any]]
 
 
@@ -116,7 +280,45 @@ class SelectList(Proxy["Select", t.List]):
             if len(rows[0].keys()) != 1:
                 raise ValueError("Each row returned more than one value")
 
-            response = list(itertools.chain(*[j.values() for j in rows]))
+            # Every row has the same key, so we only need to look it up once.
+            key = next(iter(rows[0]))
+            response = [row[key] for row in rows]
+
+        modified_response = await self.query.callback_delegate.invoke(
+            results=response, kind=CallbackType.success
+        )
+        return modified_response
+
+
+class SelectColumns(Proxy["Select", t.Dict[str, t.List]]):
+    """
+    This is for static typing purposes.
+    """
+
+    async def run(
+        self,
+        node: t.Optional[str] = None,
+        in_pool: bool = True,
+    ) -> t.Dict[str, t.List]:
+        rows = await self.query.run(
+            node=node, in_pool=in_pool, use_callbacks=False
+        )
+
+        if rows:
+            # Every row has the same keys, so they only need to be looked up
+            # from the first row.
+            response = {key: [row[key] for row in rows] for key in rows[0]}
+        else:
+            # Still include the selected columns, so the column names aren't
+            # lost when there are no rows.
+            response = {
+                key: []
+                for key in (
+                    _get_selectable_key(i)
+                    for i in self.query.columns_delegate.selected_columns
+                )
+                if key is not None
+            }
 
         modified_response = await self.query.callback_delegate.invoke(
             results=response, kind=CallbackType.success
@@ -142,19 +344,33 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
     __slots__ = (
         "columns_list",
         "exclude_secrets",
-        "as_of_delegate",
         "columns_delegate",
-        "distinct_delegate",
-        "group_by_delegate",
-        "limit_delegate",
-        "offset_delegate",
-        "order_by_delegate",
         "output_delegate",
-        "callback_delegate",
-        "where_delegate",
-        "lock_rows_delegate",
+        "_as_of_delegate",
+        "_distinct_delegate",
+        "_group_by_delegate",
+        "_limit_delegate",
+        "_offset_delegate",
+        "_order_by_delegate",
+        "_callback_delegate",
+        "_where_delegate",
+        "_lock_rows_delegate",
+        "_engine_type",
+        "_formatted_tablename",
     )
 
+    # Most queries only use a few of these, so they're only created when
+    # first accessed.
+    as_of_delegate = LazyDelegate(AsOfDelegate)
+    distinct_delegate = LazyDelegate(DistinctDelegate)
+    group_by_delegate = LazyDelegate(GroupByDelegate)
+    limit_delegate = LazyDelegate(LimitDelegate)
+    offset_delegate = LazyDelegate(OffsetDelegate)
+    order_by_delegate = LazyDelegate(OrderByDelegate)
+    callback_delegate = LazyDelegate(CallbackDelegate)
+    where_delegate = LazyDelegate(WhereDelegate)
+    lock_rows_delegate = LazyDelegate(LockRowsDelegate)
+
     def __init__(
         self,
         table: t.Type[TableInstance],
@@ -167,23 +383,50 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
         super().__init__(table, **kwargs)
         self.exclude_secrets = exclude_secrets
 
-        self.as_of_delegate = AsOfDelegate()
+        # These are resolved lazily, as the engine might not be available
+        # when the query is created.
+        self._engine_type: t.Optional[str] = None
+        self._formatted_tablename: t.Optional[str] = None
+
         self.columns_delegate = ColumnsDelegate()
-        self.distinct_delegate = DistinctDelegate()
-        self.group_by_delegate = GroupByDelegate()
-        self.limit_delegate = LimitDelegate()
-        self.offset_delegate = OffsetDelegate()
-        self.order_by_delegate = OrderByDelegate()
         self.output_delegate = OutputDelegate()
-        self.callback_delegate = CallbackDelegate()
-        self.where_delegate = WhereDelegate()
-        self.lock_rows_delegate = LockRowsDelegate()
+
+        self._as_of_delegate: t.Optional[AsOfDelegate] = None
+        self._distinct_delegate: t.Optional[DistinctDelegate] = None
+        self._group_by_delegate: t.Optional[GroupByDelegate] = None
+        self._limit_delegate: t.Optional[LimitDelegate] = None
+        self._offset_delegate: t.Optional[OffsetDelegate] = None
+        self._order_by_delegate: t.Optional[OrderByDelegate] = None
+        self._callback_delegate: t.Optional[CallbackDelegate] = None
+        self._where_delegate: t.Optional[WhereDelegate] = None
+        self._lock_rows_delegate: t.Optional[LockRowsDelegate] = None
 
         self.columns(*columns_list)
 
+    @property
+    def engine_type(self) -> str:
+        # It's used several times while building and running the query, so is
+        # cached to save walking the table's attributes each time.
+        if self._engine_type is None:
+            self._engine_type = super().engine_type
+        return self._engine_type
+
+    def _get_formatted_tablename(self) -> str:
+        if self._formatted_tablename is None:
+            self._formatted_tablename = (
+                self.table._meta.get_formatted_tablename()
+            )
+        return self._formatted_tablename
+
     def columns(self: Self, *columns: t.Union[Selectable, str]) -> Self:
-        _columns = self.table._process_column_args(*columns)
-        self.columns_delegate.columns(*_columns)
+        columns_delegate = self.columns_delegate
+        column_count = len(columns_delegate.selected_columns)
+        columns_delegate.columns(*self.table._process_column_args(*columns))
+        # Validate the columns as they're added (the delegate has already
+        # flattened any lists), rather than every time the query is built.
+        self._check_valid_call_chain(
+            columns_delegate.selected_columns[column_count:]
+        )
         return self
 
     def distinct(
@@ -248,56 +491,77 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
         response: t.List[t.Dict[str, t.Any]],
         secondary_table: t.Type[Table],
         secondary_table_pk: Column,
-        m2m_name: str,
-        m2m_select: M2MSelect,
-        as_list: bool = False,
+        m2m_selects: t.Sequence[M2MSelect],
+        load_json: bool = False,
     ):
-        row_ids = list(
-            set(itertools.chain(*[row[m2m_name] for row in response]))
-        )
+        """
+        Fetches the related rows for each of the ``m2m_selects`` using a
+        single query, and splices them into the response. All of the
+        ``m2m_selects`` must share the same ``secondary_table``.
+        """
+        unique_row_ids: t.Set[t.Any] = set()
+        for m2m_select in m2m_selects:
+            m2m_name = m2m_select.m2m._meta.name
+            for row in response:
+                unique_row_ids.update(row[m2m_name])
+        row_ids = list(unique_row_ids)
+
+        columns: t.Dict[str, Column] = {}
+        for m2m_select in m2m_selects:
+            for column in m2m_select.columns:
+                columns.setdefault(_get_column_key(column), column)
+
         extra_rows = (
             (
                 await secondary_table.select(
-                    *m2m_select.columns,
+                    *columns.values(),
                     secondary_table_pk.as_alias("mapping_key"),
                 )
                 .where(secondary_table_pk.is_in(row_ids))
-                .output(load_json=m2m_select.load_json)
+                .output(load_json=load_json)
                 .run()
             )
             if row_ids
             else []
         )
-        if as_list:
-            column_name = m2m_select.columns[0]._meta.name
-            extra_rows_map = {
-                row["mapping_key"]: row[column_name] for row in extra_rows
-            }
-        else:
-            extra_rows_map = {
-                row["mapping_key"]: {
-                    key: value
-                    for key, value in row.items()
-                    if key != "mapping_key"
+
+        for m2m_select in m2m_selects:
+            m2m_name = m2m_select.m2m._meta.name
+            keys = [_get_column_key(column) for column in m2m_select.columns]
+
+            if m2m_select.as_list:
+                column_name = keys[0]
+                extra_rows_map = {
+                    row["mapping_key"]: row[column_name] for row in extra_rows
                 }
-                for row in extra_rows
-            }
-        for row in response:
-            row[m2m_name] = [extra_rows_map.get(i) for i in row[m2m_name]]
+            else:
+                extra_rows_map = {
+                    row["mapping_key"]: {key: row[key] for key in keys}
+                    for row in extra_rows
+                }
+
+            for row in response:
+                row[m2m_name] = [extra_rows_map.get(i) for i in row[m2m_name]]
+
         return response
 
     async def response_handler(self, response):
-        m2m_selects = [
-            i
-            for i in self.columns_delegate.selected_columns
-            if isinstance(i, M2MSelect)
-        ]
+        if not response:
+            # There's nothing to post-process.
+            return response
+
+        # Resolve the engine type once, rather than for every M2M column.
+        engine_type = self.engine_type
+
+        m2m_selects = self.columns_delegate.get_selected_of_type(M2MSelect)
+        splice_m2m_selects: t.List[M2MSelect] = []
+
         for m2m_select in m2m_selects:
             m2m_name = m2m_select.m2m._meta.name
             secondary_table = m2m_select.m2m._meta.secondary_table
             secondary_table_pk = secondary_table._meta.primary_key
 
-            if self.engine_type == "sqlite":
+            if engine_type == "sqlite":
                 # With M2M queries in SQLite, we always get the value back as a
                 # list of strings, so we need to do some type conversion.
                 value_type = (
@@ -308,11 +572,12 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
                 try:
                     for row in response:
                         data = row[m2m_name]
-                        row[m2m_name] = (
-                            [value_type(i) for i in row[m2m_name]]
-                            if data
-                            else []
-                        )
+                        if not data:
+                            row[m2m_name] = []
+                        elif value_type is not str:
+                            # The values are already strings, so only need
+                            # converting if a different type is expected.
+                            row[m2m_name] = list(map(value_type, data))
                 except ValueError:
                     colored_warning(
                         "Unable to do type conversion for the "
@@ -327,14 +592,7 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
                     if m2m_select.serialisation_safe:
                         pass
                     else:
-                        response = await self._splice_m2m_rows(
-                            response,
-                            secondary_table,
-                            secondary_table_pk,
-                            m2m_name,
-                            m2m_select,
-                            as_list=True,
-                        )
+                        splice_m2m_selects.append(m2m_select)
                 else:
                     if (
                         len(m2m_select.columns) == 1
@@ -346,15 +604,9 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
                                 {column_name: i} for i in row[m2m_name]
                             ]
                     else:
-                        response = await self._splice_m2m_rows(
-                            response,
-                            secondary_table,
-                            secondary_table_pk,
-                            m2m_name,
-                            m2m_select,
-                        )
-
-            elif self.engine_type in ("postgres", "cockroach"):
+                        splice_m2m_selects.append(m2m_select)
+
+            elif engine_type in ("postgres", "cockroach"):
                 if m2m_select.as_list:
                     # We get the data back as an array, and can just return it
                     # unless it's JSON.
@@ -376,13 +628,19 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
                     # If the data can't be safely serialised as JSON, we get
                     # back an array of primary key values, and need to
                     # splice in the correct values using Python.
-                    response = await self._splice_m2m_rows(
-                        response,
-                        secondary_table,
-                        secondary_table_pk,
-                        m2m_name,
-                        m2m_select,
-                    )
+                    splice_m2m_selects.append(m2m_select)
+
+        # Any M2M relations which need their rows fetching using a subsequent
+        # query are grouped by table, so only one query is needed per table.
+        for m2m_group in _group_m2m_selects(splice_m2m_selects):
+            secondary_table = m2m_group[0].m2m._meta.secondary_table
+            response = await self._splice_m2m_rows(
+                response,
+                secondary_table,
+                secondary_table._meta.primary_key,
+                m2m_group,
+                load_json=m2m_group[0].load_json,
+            )
 
         #######################################################################
 
@@ -391,7 +649,7 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
         was_select_star = len(self.columns_delegate.selected_columns) == 0
 
         if self.output_delegate._output.nested and not was_select_star:
-            return [make_nested(i) for i in response]
+            return make_nested_list(response)
         else:
             return response
 
@@ -423,6 +681,10 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
     def output(self: Self, *, as_json: bool) -> SelectJSON:  # type: ignore
         ...
 
+    @t.overload
+    def output(self: Self, *, as_columns: bool) -> SelectColumns:  # type: ignore  # noqa: E501
+        ...
+
     @t.overload
     def output(self: Self, *, load_json: bool) -> Self: ...
 
@@ -443,17 +705,21 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
         as_json: bool = False,
         load_json: bool = False,
         nested: bool = False,
-    ) -> t.Union[Self, SelectJSON, SelectList]:
+        as_columns: bool = False,
+    ) -> t.Union[Self, SelectJSON, SelectList, SelectColumns]:
         self.output_delegate.output(
             as_list=as_list,
             as_json=as_json,
             load_json=load_json,
             nested=nested,
+            as_columns=as_columns,
         )
         if as_list:
             return SelectList(query=self)
         elif as_json:
             return SelectJSON(query=self)
+        elif as_columns:
+            return SelectColumns(query=self)
 
         return self
 
@@ -510,37 +776,10 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
             if not isinstance(column, Column):
                 continue
 
-            _joins: t.List[str] = []
-            for index, key in enumerate(column._meta.call_chain, 0):
-                table_alias = key.table_alias
-
-                if index > 0:
-                    left_tablename = column._meta.call_chain[
-                        index - 1
-                    ].table_alias
-                else:
-                    left_tablename = (
-                        key._meta.table._meta.get_formatted_tablename()
-                    )  # noqa: E501
-
-                right_tablename = (
-                    key._foreign_key_meta.resolved_references._meta.get_formatted_tablename()  # noqa: E501
-                )
-
-                pk_name = column._meta.call_chain[
-                    index
-                ]._foreign_key_meta.resolved_target_column._meta.name
-
-                _joins.append(
-                    f'LEFT JOIN {right_tablename} "{table_alias}"'
-                    " ON "
-                    f'({left_tablename}."{key._meta.db_column_name}" = "{table_alias}"."{pk_name}")'  # noqa: E501
-                )
-
-            joins.extend(_joins)
+            joins.extend(_get_column_joins(column))
 
         # Remove duplicates
-        return list(OrderedDict.fromkeys(joins))
+        return list(dict.fromkeys(joins))
 
     def _check_valid_call_chain(self, keys: t.Sequence[Selectable]) -> bool:
         for column in keys:
@@ -557,32 +796,51 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
 
     @property
     def default_querystrings(self) -> t.Sequence[QueryString]:
-        # JOIN
-        self._check_valid_call_chain(self.columns_delegate.selected_columns)
+        # Only delegates which have been used need to be checked - the rest
+        # are still ``None``.
+        as_of_delegate = self._as_of_delegate
+        distinct_delegate = self._distinct_delegate
+        group_by_delegate = self._group_by_delegate
+        limit_delegate = self._limit_delegate
+        offset_delegate = self._offset_delegate
+        order_by_delegate = self._order_by_delegate
+        where_delegate = self._where_delegate
+        lock_rows_delegate = self._lock_rows_delegate
 
+        # JOIN
         select_joins = self._get_joins(self.columns_delegate.selected_columns)
-        where_joins = self._get_joins(self.where_delegate.get_where_columns())
-        order_by_joins = self._get_joins(
-            self.order_by_delegate.get_order_by_columns()
+        where_joins = (
+            self._get_joins(where_delegate.get_where_columns())
+            if where_delegate is not None
+            else []
+        )
+        order_by_joins = (
+            self._get_joins(order_by_delegate.get_order_by_columns())
+            if order_by_delegate is not None
+            else []
         )
 
         # Combine all joins, and remove duplicates
         joins: t.List[str] = list(
-            OrderedDict.fromkeys(select_joins + where_joins + order_by_joins)
+            dict.fromkeys(select_joins + where_joins + order_by_joins)
         )
 
         #######################################################################
 
         # If no columns have been specified for selection, select all columns
-        # on the table:
+        # on the table (omitting secret columns if required - the table
+        # already keeps a list of them, so no filtering is needed):
         if len(self.columns_delegate.selected_columns) == 0:
-            self.columns_delegate.selected_columns = self.table._meta.columns
-
-        # If secret fields need to be omitted, remove them from the list.
-        if self.exclude_secrets:
+            self.columns_delegate.selected_columns = (
+                self.table._meta.non_secret_columns
+                if self.exclude_secrets
+                else self.table._meta.columns
+            )
+        elif self.exclude_secrets:
+            # If secret fields need to be omitted, remove them from the list.
             self.columns_delegate.remove_secret_columns()
 
-        engine_type = self.table._meta.db.engine_type
+        engine_type = self.engine_type
 
         select_strings: t.List[QueryString] = [
             c.get_select_string(engine_type=engine_type)
@@ -593,66 +851,79 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
 
         args: t.List[t.Any] = []
 
-        query = "SELECT"
+        # The query is assembled from fragments, which are joined at the end,
+        # rather than repeatedly concatenating strings.
+        query_parts: t.List[str] = ["SELECT"]
 
-        distinct = self.distinct_delegate._distinct
+        distinct = (
+            distinct_delegate._distinct
+            if distinct_delegate is not None
+            else _DISTINCT_DISABLED
+        )
         if distinct.on:
             distinct.validate_on(self.order_by_delegate._order_by)
-        query += "{}"
+        query_parts.append("{}")
         args.append(distinct.querystring)
 
-        columns_str = ", ".join("{}" for _ in select_strings)
-        query += f" {columns_str} FROM {self.table._meta.get_formatted_tablename()}"  # noqa: E501
+        query_parts.append(" ")
+        query_parts.append(", ".join(["{}"] * len(select_strings)))
+        query_parts.append(" FROM ")
+        query_parts.append(self._get_formatted_tablename())
         args.extend(select_strings)
 
         for join in joins:
-            query += f" {join}"
+            query_parts.append(" ")
+            query_parts.append(join)
 
-        if self.as_of_delegate._as_of:
-            query += "{}"
-            args.append(self.as_of_delegate._as_of.querystring)
+        if as_of_delegate is not None and as_of_delegate._as_of:
+            query_parts.append("{}")
+            args.append(as_of_delegate._as_of.querystring)
 
-        if self.where_delegate._where:
-            query += " WHERE {}"
-            args.append(self.where_delegate._where.querystring)
+        if where_delegate is not None and where_delegate._where:
+            query_parts.append(" WHERE {}")
+            args.append(where_delegate._where.querystring)
 
-        if self.group_by_delegate._group_by:
-            query += "{}"
-            args.append(self.group_by_delegate._group_by.querystring)
-
-        if self.order_by_delegate._order_by.order_by_items:
-            query += "{}"
-            args.append(self.order_by_delegate._order_by.querystring)
+        if group_by_delegate is not None and group_by_delegate._group_by:
+            query_parts.append("{}")
+            args.append(group_by_delegate._group_by.querystring)
 
         if (
-            engine_type == "sqlite"
-            and self.offset_delegate._offset
-            and not self.limit_delegate._limit
+            order_by_delegate is not None
+            and order_by_delegate._order_by.order_by_items
         ):
+            query_parts.append("{}")
+            args.append(order_by_delegate._order_by.querystring)
+
+        limit = limit_delegate._limit if limit_delegate is not None else None
+        offset = (
+            offset_delegate._offset if offset_delegate is not None else None
+        )
+
+        if engine_type == "sqlite" and offset and not limit:
             raise ValueError(
                 "A limit clause must be provided when doing an offset with "
                 "SQLite."
             )
 
-        if self.limit_delegate._limit:
-            query += "{}"
-            args.append(self.limit_delegate._limit.querystring)
+        if limit:
+            query_parts.append("{}")
+            args.append(limit.querystring)
 
-        if self.offset_delegate._offset:
-            query += "{}"
-            args.append(self.offset_delegate._offset.querystring)
+        if offset:
+            query_parts.append("{}")
+            args.append(offset.querystring)
 
-        if self.lock_rows_delegate._lock_rows:
+        if lock_rows_delegate is not None and lock_rows_delegate._lock_rows:
             if engine_type == "sqlite":
                 raise NotImplementedError(
                     "SQLite doesn't support row locking e.g. SELECT ... FOR "
                     "UPDATE"
                 )
 
-            query += "{}"
-            args.append(self.lock_rows_delegate._lock_rows.querystring)
+            query_parts.append("{}")
+            args.append(lock_rows_delegate._lock_rows.querystring)
 
-        querystring = QueryString(query, *args)
+        querystring = QueryString("".join(query_parts), *args)
 
         return [querystring]
 
@@ -664,8 +935,8 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
         **kwargs,
     ) -> t.List[t.Dict[str, t.Any]]:
         results = await super().run(node=node, in_pool=in_pool)
-        if use_callbacks:
-            return await self.callback_delegate.invoke(
+        if use_callbacks and self._callback_delegate is not None:
+            return await self._callback_delegate.invoke(
                 results, kind=CallbackType.success
             )
         else:
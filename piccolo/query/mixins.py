@@ -20,6 +20,9 @@ if t.TYPE_CHECKING:  # pragma: no cover
     from piccolo.table import Table  # noqa
 
 
+SelectableType = t.TypeVar("SelectableType")
+
+
 class DistinctOnError(ValueError):
     """
     Raised when ``DISTINCT ON`` queries are malformed.
@@ -209,6 +212,7 @@ class Returning:
 class Output:
     as_json: bool = False
     as_list: bool = False
+    as_columns: bool = False
     as_objects: bool = False
     load_json: bool = False
     nested: bool = False
@@ -217,6 +221,7 @@ class Output:
         return self.__class__(
             as_json=self.as_json,
             as_list=self.as_list,
+            as_columns=self.as_columns,
             as_objects=self.as_objects,
             load_json=self.load_json,
             nested=self.nested,
@@ -378,6 +383,7 @@ class OutputDelegate:
     .output(as_list=True)
     .output(as_json=True)
     .output(as_json=True, as_list=True)
+    .output(as_columns=True)
     """
 
     _output: Output = field(default_factory=Output)
@@ -388,6 +394,7 @@ class OutputDelegate:
         as_json: t.Optional[bool] = None,
         load_json: t.Optional[bool] = None,
         nested: t.Optional[bool] = None,
+        as_columns: t.Optional[bool] = None,
     ):
         """
         :param as_list:
@@ -399,6 +406,9 @@ class OutputDelegate:
         :param load_json:
             If True, any JSON fields will have the JSON values returned from
             the database loaded as Python objects.
+        :param as_columns:
+            The results are returned as a dictionary, mapping each column name
+            to a list of its values.
         """
         # We do it like this, so output can be called multiple times, without
         # overriding any existing values if they're not specified.
@@ -414,6 +424,9 @@ class OutputDelegate:
         if nested is not None:
             self._output.nested = bool(nested)
 
+        if as_columns is not None:
+            self._output.as_columns = bool(as_columns)
+
     def copy(self) -> OutputDelegate:
         return self.__class__(_output=self._output.copy())
 
@@ -503,6 +516,12 @@ class ColumnsDelegate:
 
     selected_columns: t.Sequence[Selectable] = field(default_factory=list)
 
+    # Caches the results of ``get_selected_of_type``. It's discarded whenever
+    # ``selected_columns`` is replaced.
+    _selected_by_type: t.Optional[
+        t.Tuple[t.Sequence[Selectable], t.Dict[t.Any, t.List[t.Any]]]
+    ] = field(default=None, init=False, repr=False, compare=False)
+
     def columns(self, *columns: t.Union[Selectable, t.List[Selectable]]):
         """
         :param columns:
@@ -524,6 +543,38 @@ class ColumnsDelegate:
 
         self.selected_columns = non_secret
 
+    def get_selected_of_type(
+        self,
+        selectable_type: t.Union[
+            t.Type[SelectableType], t.Tuple[t.Type[SelectableType], ...]
+        ],
+    ) -> t.List[SelectableType]:
+        """
+        Returns the selected columns which are instances of
+        ``selectable_type`` (either a type, or a tuple of types, like
+        ``isinstance`` accepts).
+
+        The result is cached until the selected columns change, so we don't
+        have to keep checking every selected column with ``isinstance``.
+        """
+        cached = self._selected_by_type
+        if cached is None or cached[0] is not self.selected_columns:
+            cached = (self.selected_columns, {})
+            self._selected_by_type = cached
+
+        selected_by_type = cached[1]
+
+        selected = selected_by_type.get(selectable_type)
+        if selected is None:
+            selected = [
+                i
+                for i in self.selected_columns
+                if isinstance(i, selectable_type)
+            ]
+            selected_by_type[selectable_type] = selected
+
+        return selected
+
 
 @dataclass
 class ValuesDelegate:
@@ -872,3 +923,58 @@ class LockRowsDelegate:
             raise ValueError("Unrecognised `lock_strength` value.")
 
         self._lock_rows = LockRows(lock_strength_, nowait, skip_locked, of)
+
+
+DelegateType = t.TypeVar("DelegateType")
+
+
+class LazyDelegate(t.Generic[DelegateType]):
+    """
+    A descriptor which only creates the delegate when it's first accessed.
+
+    Most queries only use a handful of their delegates, so there's no point
+    creating all of them up front. The delegate is stored in a slot with the
+    same name, prefixed with an underscore, which contains ``None`` until the
+    delegate is needed.
+
+    .. code-block:: python
+
+        class MyQuery(Query):
+            __slots__ = ("_limit_delegate",)
+
+            limit_delegate = LazyDelegate(LimitDelegate)
+
+            def __init__(self, ...):
+                self._limit_delegate = None
+
+    """
+
+    __slots__ = ("delegate_class", "attr_name")
+
+    def __init__(self, delegate_class: t.Type[DelegateType]):
+        self.delegate_class = delegate_class
+        self.attr_name = ""
+
+    def __set_name__(self, owner: t.Type, name: str):
+        self.attr_name = f"_{name}"
+
+    @t.overload
+    def __get__(
+        self, instance: None, owner: t.Type
+    ) -> LazyDelegate[DelegateType]: ...
+
+    @t.overload
+    def __get__(self, instance: t.Any, owner: t.Type) -> DelegateType: ...
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        delegate = getattr(instance, self.attr_name)
+        if delegate is None:
+            delegate = self.delegate_class()
+            setattr(instance, self.attr_name, delegate)
+        return delegate
+
+    def __set__(self, instance: t.Any, value: DelegateType):
+        setattr(instance, self.attr_name, value)
@@ -68,6 +68,7 @@ class QueryString(Selectable):
         "query_type",
         "table",
         "_frozen_compiled_strings",
+        "_aliased_select_string",
         "columns",
     )
 
@@ -102,6 +103,9 @@ class QueryString(Selectable):
         self._frozen_compiled_strings: t.Optional[
             t.Tuple[str, t.List[t.Any]]
         ] = None
+        self._aliased_select_string: t.Optional[t.Tuple[str, QueryString]] = (
+            None
+        )
         self._alias = alias
         self.args, self.columns = self.process_args(args)
 
@@ -246,7 +250,16 @@ class QueryString(Selectable):
         self, engine_type: str, with_alias: bool = True
     ) -> QueryString:
         if with_alias and self._alias:
-            return QueryString("{} AS " + f'"{self._alias}"', self)
+            # The aliased wrapper only depends on the alias, so we can reuse
+            # it across queries, unless ``as_alias`` has since been called.
+            cached = self._aliased_select_string
+            if cached is None or cached[0] != self._alias:
+                cached = (
+                    self._alias,
+                    QueryString("{} AS " + f'"{self._alias}"', self),
+                )
+                self._aliased_select_string = cached
+            return cached[1]
         else:
             return self
 
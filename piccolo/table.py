@@ -84,6 +84,13 @@ class TableMeta:
     primary_key: Column = field(default_factory=Column)
     json_columns: t.List[t.Union[JSON, JSONB]] = field(default_factory=list)
     secret_columns: t.List[Secret] = field(default_factory=list)
+
+    # Filtered using ``_meta.secret`` (the same as
+    # ``ColumnsDelegate.remove_secret_columns``), so any column with
+    # ``secret=True`` is excluded, not just ``Secret`` columns. This means it
+    # isn't the complement of ``secret_columns``.
+    non_secret_columns: t.List[Column] = field(default_factory=list)
+
     auto_update_columns: t.List[Column] = field(default_factory=list)
     tags: t.List[str] = field(default_factory=list)
     help_text: t.Optional[str] = None
@@ -274,6 +281,7 @@ class Table(metaclass=TableMetaclass):
         array_columns: t.List[Array] = []
         foreign_key_columns: t.List[ForeignKey] = []
         secret_columns: t.List[Secret] = []
+        non_secret_columns: t.List[Column] = []
         json_columns: t.List[t.Union[JSON, JSONB]] = []
         email_columns: t.List[Email] = []
         auto_update_columns: t.List[Column] = []
@@ -317,6 +325,9 @@ class Table(metaclass=TableMetaclass):
                 if isinstance(column, Secret):
                     secret_columns.append(column)
 
+                if not column._meta.secret:
+                    non_secret_columns.append(column)
+
                 if isinstance(column, ForeignKey):
                     foreign_key_columns.append(column)
 
@@ -336,6 +347,7 @@ class Table(metaclass=TableMetaclass):
             setattr(cls, "id", primary_key)
 
             columns.insert(0, primary_key)  # PK should be added first
+            non_secret_columns.insert(0, primary_key)
             default_columns.append(primary_key)
 
         cls._meta = TableMeta(
@@ -349,6 +361,7 @@ class Table(metaclass=TableMetaclass):
             foreign_key_columns=foreign_key_columns,
             json_columns=json_columns,
             secret_columns=secret_columns,
+            non_secret_columns=non_secret_columns,
             auto_update_columns=auto_update_columns,
             tags=tags,
             help_text=help_text,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+from functools import lru_cache
 
 
 def make_nested(dictionary: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
@@ -56,3 +57,54 @@ def make_nested(dictionary: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
             dictionary[path[-1]] = value
 
     return output
+
+
+@lru_cache(maxsize=256)
+def _get_template(keys: t.Tuple[str, ...]) -> t.Dict[str, t.Any]:
+    """
+    The template only depends on the keys, so it's cached - a query which is
+    run repeatedly doesn't need to work it out again. The returned template
+    mustn't be modified.
+    """
+    return make_nested({key: key for key in keys})
+
+
+def _fill_template(
+    template: t.Dict[str, t.Any], dictionary: t.Dict[str, t.Any]
+) -> t.Dict[str, t.Any]:
+    return {
+        key: (
+            dictionary[value]
+            if isinstance(value, str)
+            else _fill_template(value, dictionary)
+        )
+        for key, value in template.items()
+    }
+
+
+def make_nested_list(
+    dictionaries: t.List[t.Dict[str, t.Any]],
+) -> t.List[t.Dict[str, t.Any]]:
+    """
+    The same as :func:`make_nested`, but for a list of dictionaries which all
+    share the same keys - for example, the rows returned by a select query.
+
+    Rather than working out the nested structure for every dictionary, we
+    work it out once, as a template which maps each nested key to the
+    original key. For example:
+
+    .. code-block:: python
+
+        {'name': 'name', 'band': {'name': 'band.name'}}
+
+    Each dictionary is then used to fill in the template.
+
+    """
+    if not dictionaries:
+        return []
+
+    template = _get_template(tuple(dictionaries[0].keys()))
+
+    return [
+        _fill_template(template, dictionary) for dictionary in dictionaries
+    ]
@@ -6,6 +6,7 @@ try:
     import orjson
 
     ORJSON = True
+    ORJSON_PRETTY_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
 except ImportError:
     import json
 
@@ -14,19 +15,15 @@ except ImportError:
 
 def dump_json(data: t.Any, pretty: bool = False) -> str:
     if ORJSON:
-        orjson_params: t.Dict[str, t.Any] = {"default": str}
         if pretty:
-            orjson_params["option"] = (
-                orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE  # type: ignore
-            )
-        return orjson.dumps(data, **orjson_params).decode(  # type: ignore
-            "utf8"
-        )
+            return orjson.dumps(  # type: ignore
+                data, default=str, option=ORJSON_PRETTY_OPTIONS
+            ).decode("utf8")
+        return orjson.dumps(data, default=str).decode("utf8")  # type: ignore
     else:
-        params: t.Dict[str, t.Any] = {"default": str}
         if pretty:
-            params["indent"] = 2
-        return json.dumps(data, **params)  # type: ignore
+            return json.dumps(data, default=str, indent=2)  # type: ignore
+        return json.dumps(data, default=str)  # type: ignore
 
 
 class JSONDict(dict):
@@ -69,6 +66,8 @@ def load_json(data: str) -> t.Any:
     )
 
     if isinstance(response, dict):
-        return JSONDict(**response)
+        # JSON keys are always strings, so we can copy the dict directly,
+        # rather than unpacking it as keyword arguments.
+        return JSONDict(response)
 
     return response
@@ -3,6 +3,7 @@ import datetime
 import decimal
 import uuid
 from unittest import TestCase
+from unittest.mock import patch
 
 from piccolo.utils.encoding import JSONDict
 from tests.base import engines_skip
@@ -420,3 +421,97 @@ class TestM2MComplexSchema(TestCase):
                     returned_value,
                     msg=f"{column_name} doesn't match",
                 )
+
+
+###############################################################################
+
+# A schema with several M2M relationships to the same table
+
+
+class Student(Table):
+    name = Varchar()
+    major_courses = M2M(
+        LazyTableReference("StudentToMajorCourse", module_path=__name__)
+    )
+    minor_courses = M2M(
+        LazyTableReference("StudentToMinorCourse", module_path=__name__)
+    )
+
+
+class Course(Table):
+    name = Varchar()
+    credits = Numeric(digits=(5, 1))
+
+
+class StudentToMajorCourse(Table):
+    student = ForeignKey(Student)
+    course = ForeignKey(Course)
+
+
+class StudentToMinorCourse(Table):
+    student = ForeignKey(Student)
+    course = ForeignKey(Course)
+
+
+SHARED_TABLE_SCHEMA = [
+    Student,
+    Course,
+    StudentToMajorCourse,
+    StudentToMinorCourse,
+]
+
+
+class TestM2MSharedTable(TestCase):
+    """
+    When several M2M relationships point to the same table, and the values
+    can't be safely serialised, the related rows should be fetched using a
+    single query.
+    """
+
+    def setUp(self):
+        create_db_tables_sync(*SHARED_TABLE_SCHEMA, if_not_exists=True)
+
+        bob = Student.objects().create(name="Bob").run_sync()
+        maths = (
+            Course.objects()
+            .create(name="Maths", credits=decimal.Decimal("1.5"))
+            .run_sync()
+        )
+        music = (
+            Course.objects()
+            .create(name="Music", credits=decimal.Decimal("0.5"))
+            .run_sync()
+        )
+
+        StudentToMajorCourse(student=bob, course=maths).save().run_sync()
+        StudentToMinorCourse(student=bob, course=music).save().run_sync()
+
+    def tearDown(self):
+        drop_db_tables_sync(*SHARED_TABLE_SCHEMA)
+
+    @engines_skip("cockroach")
+    def test_select(self):
+        """
+        🐛 Cockroach bug: https://github.com/cockroachdb/cockroach/issues/71908 "could not decorrelate subquery" error under asyncpg
+        """  # noqa: E501
+        with patch.object(Course, "select", wraps=Course.select) as select:
+            response = Student.select(
+                Student.name,
+                Student.major_courses(Course.name, Course.credits),
+                Student.minor_courses(Course.credits),
+            ).run_sync()
+
+        self.assertEqual(select.call_count, 1)
+
+        self.assertListEqual(
+            response,
+            [
+                {
+                    "name": "Bob",
+                    "major_courses": [
+                        {"name": "Maths", "credits": decimal.Decimal("1.5")}
+                    ],
+                    "minor_courses": [{"credits": decimal.Decimal("0.5")}],
+                }
+            ],
+        )
@@ -1,6 +1,9 @@
 import time  # For time travel queries.
 
+from piccolo.columns import Column
+from piccolo.query.functions.aggregate import Count
 from piccolo.query.mixins import ColumnsDelegate
+from piccolo.querystring import QueryString
 from tests.base import DBTestCase, engines_only
 from tests.example_apps.music.tables import Band
 
@@ -28,6 +31,35 @@ class TestColumnsDelegate(DBTestCase):
             columns_delegate.selected_columns, [Band.name, Band.id]
         )
 
+    def test_get_selected_of_type(self):
+        """
+        Make sure the selected columns can be filtered by type, and that the
+        cached result is discarded when the selected columns change.
+        """
+        columns_delegate = ColumnsDelegate()
+        count = Count()
+
+        columns_delegate.columns(Band.name, count)
+        self.assertIs(
+            columns_delegate.get_selected_of_type(Column)[0], Band.name
+        )
+        self.assertIs(
+            columns_delegate.get_selected_of_type(Column),
+            columns_delegate.get_selected_of_type(Column),
+        )
+        self.assertEqual(
+            columns_delegate.get_selected_of_type(QueryString), [count]
+        )
+
+        columns_delegate.columns(Band.popularity)
+        self.assertEqual(
+            [
+                i._meta.name
+                for i in columns_delegate.get_selected_of_type(Column)
+            ],
+            ["name", "popularity"],
+        )
+
     @engines_only("cockroach")
     def test_as_of(self):
         """
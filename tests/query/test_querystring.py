@@ -30,6 +30,23 @@ class TestQueryString(TestCase):
         qs = QueryString("SELECT name FROM band")
         self.assertEqual(qs.compile_string(), ("SELECT name FROM band", []))
 
+    def test_select_string_cached(self):
+        """
+        The aliased select string should be reused, unless the alias changes.
+        """
+        qs = QueryString("COUNT(*)", alias="total")
+        select_string = qs.get_select_string(engine_type="postgres")
+        self.assertIs(
+            qs.get_select_string(engine_type="postgres"), select_string
+        )
+        self.assertEqual(select_string.__str__(), 'COUNT(*) AS "total"')
+
+        qs.as_alias("count")
+        self.assertEqual(
+            qs.get_select_string(engine_type="postgres").__str__(),
+            'COUNT(*) AS "count"',
+        )
+
 
 @postgres_only
 class TestQueryStringOperators(TestCase):
@@ -486,3 +486,27 @@ class TestJoin(TestCase):
 
         self.assertIsInstance(ticket.concert.band_2.manager.id, int)
         self.assertIsInstance(ticket.concert.band_2.manager.name, str)
+
+
+class TestJoinCache(TestCase):
+    def tearDown(self):
+        Manager._meta.schema = None
+
+    def test_schema_change(self):
+        """
+        The joins are cached on the column, but they need to be regenerated if
+        the schema of a joined table changes.
+        """
+        column = Band.manager.name
+
+        self.assertIn(
+            'LEFT JOIN "manager" "band$manager"',
+            Band.select(column).__str__(),
+        )
+
+        Manager._meta.schema = "music"
+
+        self.assertIn(
+            'LEFT JOIN "music"."manager" "band$manager"',
+            Band.select(column).__str__(),
+        )
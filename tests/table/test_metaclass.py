@@ -109,6 +109,21 @@ class TestMetaClass(TestCase):
             Classified._meta.secret_columns, [Classified.top_secret]
         )
 
+    def test_non_secret_columns(self):
+        """
+        Make sure TableMeta.non_secret_columns are setup correctly.
+        """
+
+        class Classified(Table):
+            name = Varchar()
+            top_secret = Secret()
+            password = Varchar(secret=True)
+
+        self.assertEqual(
+            [i._meta.name for i in Classified._meta.non_secret_columns],
+            ["id", "name"],
+        )
+
     def test_json_columns(self):
         """
         Make sure TableMeta.json_columns are setup correctly.
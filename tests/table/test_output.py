@@ -1,6 +1,7 @@
 import json
 from unittest import TestCase
 
+from piccolo.query.functions import Upper
 from piccolo.table import create_db_tables_sync, drop_db_tables_sync
 from tests.base import DBTestCase
 from tests.example_apps.music.tables import Band, Instrument, RecordingStudio
@@ -23,6 +24,41 @@ class TestOutputList(DBTestCase):
         self.assertEqual(empty_response, [])
 
 
+class TestOutputColumns(DBTestCase):
+    def test_output_as_columns(self):
+        self.insert_rows()
+
+        response = (
+            Band.select(Band.name, Band.popularity)
+            .order_by(Band.name)
+            .output(as_columns=True)
+            .run_sync()
+        )
+        self.assertEqual(
+            response,
+            {
+                "name": ["CSharps", "Pythonistas", "Rustaceans"],
+                "popularity": [10, 1000, 2000],
+            },
+        )
+
+        # Make sure that if no rows are found, the column names are still
+        # returned.
+        empty_response = (
+            Band.select(
+                Band.name,
+                Band.manager.name,
+                Upper(Band.name, alias="upper_name"),
+            )
+            .where(Band.name == "ABC123")
+            .output(as_columns=True)
+            .run_sync()
+        )
+        self.assertEqual(
+            empty_response, {"name": [], "manager.name": [], "upper_name": []}
+        )
+
+
 class TestOutputJSON(DBTestCase):
     def test_output_as_json(self):
         self.insert_row()
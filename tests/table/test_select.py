@@ -1449,3 +1449,50 @@ class TestDistinctOn(TestCase):
             Album.select().distinct(on=[Album.band]).order_by(
                 Album.release_date
             ).run_sync()
+
+
+class TestLazyDelegates(TestCase):
+    def test_lazy_delegates(self):
+        """
+        Delegates should only be created when they're needed, and the query
+        should still be generated correctly without them.
+        """
+        query = Band.select(Band.name)
+        self.assertIsNone(query._where_delegate)
+        self.assertIsNone(query._limit_delegate)
+        self.assertEqual(
+            query.__str__(), 'SELECT ALL "band"."name" AS "name" FROM "band"'
+        )
+
+        query = query.limit(1)
+        self.assertIsNotNone(query._limit_delegate)
+        self.assertIsNone(query._where_delegate)
+        self.assertEqual(
+            query.__str__(),
+            'SELECT ALL "band"."name" AS "name" FROM "band" LIMIT 1',
+        )
+
+
+class TestCallChainLength(TestCase):
+    def test_call_chain_too_long(self):
+        """
+        Selecting a column which needs more than 10 joins should raise an
+        exception as soon as it's added to the query.
+
+        Traversing the foreign keys stops before then, so the call chain is
+        set manually.
+        """
+        column = Band.manager.name.copy()
+        column._meta.call_chain = [Band.manager] * 11
+
+        with self.assertRaises(Exception) as manager:
+            Band.select(column)
+
+        self.assertEqual(
+            manager.exception.__str__(),
+            "Joining more than 10 tables isn't supported - please "
+            "restructure your query.",
+        )
+
+        with self.assertRaises(Exception):
+            Band.select().columns([column])
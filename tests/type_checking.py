@@ -81,6 +81,12 @@ if t.TYPE_CHECKING:
         # The next step would be to detect that it's t.List[str], but might not
         # be possible.
 
+    async def select_columns() -> None:
+        query = Band.select(Band.name).output(as_columns=True)
+        assert_type(await query, t.Dict[str, t.List])
+        assert_type(await query.run(), t.Dict[str, t.List])
+        assert_type(query.run_sync(), t.Dict[str, t.List])
+
     async def select_as_json() -> None:
         query = Band.select(Band.name).output(as_json=True)
         assert_type(await query, str)
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from piccolo.utils.dictionary import make_nested
+from piccolo.utils.dictionary import make_nested, make_nested_list
 
 
 class TestMakeNested(TestCase):
@@ -54,3 +54,39 @@ class TestMakeNested(TestCase):
                 },
             },
         )
+
+
+class TestMakeNestedList(TestCase):
+    def test_nesting(self):
+        rows = [
+            {
+                "name": "Pythonistas",
+                "manager": 1,
+                "manager.name": "Guido",
+                "manager.car.colour": "green",
+            },
+            {
+                "name": "Rustaceans",
+                "manager": 2,
+                "manager.name": "Graydon",
+                "manager.car.colour": "red",
+            },
+        ]
+        self.assertEqual(
+            make_nested_list(rows), [make_nested(row) for row in rows]
+        )
+
+    def test_empty(self):
+        self.assertEqual(make_nested_list([]), [])
+
+    def test_different_keys(self):
+        """
+        The templates are cached by key, so make sure responses with different
+        keys don't share a template.
+        """
+        self.assertEqual(
+            make_nested_list([{"a": 1, "b.c": 2}]), [{"a": 1, "b": {"c": 2}}]
+        )
+        self.assertEqual(
+            make_nested_list([{"a": 1, "b.d": 2}]), [{"a": 1, "b": {"d": 2}}]
+        )
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from piccolo.utils.encoding import dump_json, load_json
+from piccolo.utils.encoding import JSONDict, dump_json, load_json
 
 
 class TestEncodingDecoding(TestCase):
@@ -10,3 +10,16 @@ class TestEncodingDecoding(TestCase):
         """
         payload = {"a": [1, 2, 3]}
         self.assertEqual(load_json(dump_json(payload)), payload)
+
+    def test_dump_pretty(self):
+        payload = {"a": 1}
+        self.assertIn('\n  "a": 1\n', dump_json(payload, pretty=True))
+
+    def test_load_dict(self):
+        """
+        Dictionaries should be loaded as ``JSONDict``, so they can be
+        distinguished from other dictionaries.
+        """
+        response = load_json('{"a": {"b": 1}}')
+        self.assertIsInstance(response, JSONDict)
+        self.assertEqual(response, {"a": {"b": 1}})